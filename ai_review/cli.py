@@ -3,24 +3,146 @@
 Command-line interface for AI Code Review System.
 """
 
-import argparse
+import functools
 import json
 import os
+import shutil
 import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
 
-from .config_manager import ConfigManager
-from .orchestrator import ReviewOrchestrator
-from .platform import create_platform, create_reporter, detect_platform, load_platform_config
+# Separator line for the summary banner and error report
+_BAR = "=" * 80
 
+# Accepted GitHub token prefixes (personal access token, Actions installation token)
+_TOKEN_PREFIXES = ("ghp_", "ghs_")
 
-def validate_environment(platform: str) -> tuple[str | None, str]:
+# Anthropic API key prefix
+_ANTHROPIC_KEY_PREFIX = "sk-ant-"
+
+# Claude Code CLI version, cached per binary (keyed by mtime + size)
+_CLAUDE_VERSION_CACHE = os.path.join(
+    os.path.expanduser("~"), ".cache", "ai-review", "claude-version"
+)
+
+# Read-only stand-in for missing config sections (no throwaway dict per lookup)
+_EMPTY_SECTION: MappingProxyType[str, Any] = MappingProxyType({})
+
+# Output directories already created by this process
+_MKDIR_CACHE: set[str] = set()
+
+
+def _get_claude_version(claude_path: str) -> str | None:
+    """
+    Get the Claude Code CLI version, running `claude --version` only on a cache miss.
+
+    The cache is invalidated whenever the binary's mtime or size changes.
+
+    Args:
+        claude_path: Resolved path to the claude executable
+
+    Returns:
+        Version string, or None if the CLI exits with an error
+
+    Raises:
+        subprocess.TimeoutExpired: If `claude --version` does not finish in 5s
+    """
+    stat = os.stat(claude_path)
+    cache_key = f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    try:
+        with open(_CLAUDE_VERSION_CACHE, encoding="utf-8") as f:
+            cached_key, _, cached_version = f.read().partition("\n")
+        if cached_key == cache_key and cached_version.strip():
+            return cached_version.strip()
+    except OSError:
+        pass
+
+    result = subprocess.run(
+        [claude_path, "--version"],
+        capture_output=True,
+        timeout=5,
+        check=False,
+        text=True,
+        encoding="utf-8",
+    )
+    if result.returncode != 0:
+        return None
+    version = result.stdout.strip()
+
+    # Best effort: a read-only home directory just means no cache
+    try:
+        os.makedirs(os.path.dirname(_CLAUDE_VERSION_CACHE), exist_ok=True)
+        with open(_CLAUDE_VERSION_CACHE, "w", encoding="utf-8") as f:
+            f.write(f"{cache_key}\n{version}\n")
+    except OSError:
+        pass
+
+    return version
+
+
+def _probe_claude() -> tuple[str | None, str | None]:
+    """
+    Check that the Claude Code CLI is installed and working.
+
+    Returns:
+        Tuple of (version, error). Exactly one of them is None.
+    """
+    claude_path = shutil.which("claude")
+    if claude_path is None:
+        return None, (
+            "Claude Code CLI not found in PATH\n"
+            "   Install: curl -fsSL https://storage.googleapis.com/anthropic-files/claude-code/install.sh | bash\n"
+            "   Or: npm install -g @anthropic-ai/claude-code"
+        )
+
+    try:
+        version = _get_claude_version(claude_path)
+    except subprocess.TimeoutExpired:
+        return None, "Claude Code CLI check timed out"
+
+    if version is None:
+        return None, "Claude Code CLI is installed but not working"
+    return version, None
+
+
+def _print_banner(text: str) -> None:
+    """Print text between two separator bars with a single write."""
+    sys.stdout.write(f"\n{_BAR}\n{text}\n{_BAR}\n")
+
+
+def _exit_with_errors(errors: list[str]) -> None:
+    """Write environment validation errors to stderr in one syscall and exit with status 1."""
+    report = (
+        f"{_BAR}\nENVIRONMENT VALIDATION FAILED\n{_BAR}\n"
+        + "".join(f"\n{error}\n" for error in errors)
+        + f"\n{_BAR}\n"
+    )
+
+    # Anything already buffered must reach the terminal before the raw write
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        fd = sys.stderr.fileno()
+        buf = report.encode(sys.stderr.encoding or "utf-8", "backslashreplace")
+        while buf:
+            buf = buf[os.write(fd, buf) :]
+    except (AttributeError, OSError, ValueError):
+        # stderr is not backed by a file descriptor (captured, redirected, embedded)
+        sys.stderr.write(report)
+    sys.exit(1)
+
+
+def validate_environment(platform: str, check_claude: bool = True) -> tuple[str | None, str]:
     """
     Validate all required environment variables and tools.
 
     Args:
         platform: Platform type ('github' or 'gitlab')
+        check_claude: Also check the Claude Code CLI. The CLI entry point passes
+            False and runs the check in the background instead (see main()).
 
     Returns:
         Tuple of (platform_token, anthropic_api_key)
@@ -29,17 +151,18 @@ def validate_environment(platform: str) -> tuple[str | None, str]:
         SystemExit: If validation fails
     """
     errors = []
+    env = os.environ
 
     # Validate platform-specific token
     if platform == "github":
-        platform_token = os.getenv("GITHUB_TOKEN")
+        platform_token = env.get("GITHUB_TOKEN")
         if not platform_token:
             errors.append("GITHUB_TOKEN environment variable is required")
-        elif not (platform_token.startswith("ghp_") or platform_token.startswith("ghs_")):
+        elif not platform_token.startswith(_TOKEN_PREFIXES):
             errors.append("GITHUB_TOKEN appears invalid (should start with ghp_ or ghs_)")
     else:  # gitlab
         # GitLab CI provides CI_JOB_TOKEN automatically, or use GITLAB_TOKEN
-        platform_token = os.getenv("CI_JOB_TOKEN") or os.getenv("GITLAB_TOKEN")
+        platform_token = env.get("CI_JOB_TOKEN") or env.get("GITLAB_TOKEN")
         if not platform_token:
             errors.append(
                 "GitLab token required (CI_JOB_TOKEN or GITLAB_TOKEN environment variable)\n"
@@ -48,51 +171,82 @@ def validate_environment(platform: str) -> tuple[str | None, str]:
             )
 
     # Validate Anthropic API key
-    anthropic_key = os.getenv("ANTHROPIC_API_KEY")
+    anthropic_key = env.get("ANTHROPIC_API_KEY")
     if not anthropic_key:
         errors.append(
             "ANTHROPIC_API_KEY environment variable is required\n"
             "   Get your API key from: https://console.anthropic.com/\n"
             f"   Add to {platform.title()} Secrets: ANTHROPIC_API_KEY"
         )
-    elif not anthropic_key.startswith("sk-ant-"):
-        errors.append("ANTHROPIC_API_KEY appears invalid (should start with sk-ant-)")
+    elif not anthropic_key.startswith(_ANTHROPIC_KEY_PREFIX):
+        errors.append(
+            f"ANTHROPIC_API_KEY appears invalid (should start with {_ANTHROPIC_KEY_PREFIX})"
+        )
 
     # Test Claude Code CLI availability
-    try:
-        result = subprocess.run(
-            ["claude", "--version"], capture_output=True, timeout=5, check=False
-        )
-        if result.returncode == 0:
-            version = result.stdout.decode("utf-8").strip()
-            print(f"Claude Code CLI found: {version}")
+    if check_claude:
+        version, error = _probe_claude()
+        if error:
+            errors.append(error)
         else:
-            errors.append("Claude Code CLI is installed but not working")
-    except FileNotFoundError:
-        errors.append(
-            "Claude Code CLI not found in PATH\n"
-            "   Install: curl -fsSL https://storage.googleapis.com/anthropic-files/claude-code/install.sh | bash\n"
-            "   Or: npm install -g @anthropic-ai/claude-code"
-        )
-    except subprocess.TimeoutExpired:
-        errors.append("Claude Code CLI check timed out")
+            print(f"Claude Code CLI found: {version}")
 
     # Print all errors
     if errors:
-        print("=" * 80, file=sys.stderr)
-        print("ENVIRONMENT VALIDATION FAILED", file=sys.stderr)
-        print("=" * 80, file=sys.stderr)
-        for error in errors:
-            print(f"\n{error}", file=sys.stderr)
-        print("\n" + "=" * 80, file=sys.stderr)
-        sys.exit(1)
+        _exit_with_errors(errors)
 
     print(f"Environment validation passed ({platform})")
     return platform_token, anthropic_key
 
 
-def main():
-    """Main entry point for AI Code Review CLI."""
+def _ensure_parent(path: str) -> None:
+    """Create the parent directory of path once per process."""
+    parent = os.path.dirname(path)
+    if parent and parent not in _MKDIR_CACHE:
+        os.makedirs(parent, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+
+
+def _write_json(path: str, data: dict[str, Any]) -> None:
+    """
+    Write data to path as indented JSON.
+
+    Uses orjson (C extension, serializes straight to bytes) when it is installed,
+    otherwise the standard library json module.
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return
+
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+# Value-taking flags handled by the fast parser -> argparse dest
+_VALUE_FLAGS = {
+    "--platform": "platform",
+    "--repo": "repo",
+    "--pr": "pr",
+    "--config": "config",
+    "--company-config": "company_config",
+    "--output": "output",
+    "--project-root": "project_root",
+}
+
+
+@functools.cache
+def _build_parser():
+    """
+    Build the full argparse parser (used for --help, --version and usage errors).
+
+    Memoized so in-process callers (tests, wrappers calling main() repeatedly)
+    construct it only once.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="AI-Driven Code Review System (GitHub & GitLab)",
         prog="ai-review",
@@ -126,20 +280,99 @@ def main():
     # Version
     parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
 
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args_fast(argv: list[str]) -> SimpleNamespace | None:
+    """
+    Parse a well-formed CLI invocation without importing argparse.
+
+    Only exact flag names are recognized. Anything else (--help, --version,
+    abbreviations, unknown flags, missing or invalid values) returns None so
+    the caller falls back to argparse, which produces the usual messages.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        Namespace with the same attributes argparse would set, or None
+    """
+    values: dict[str, Any] = {
+        "platform": None,
+        "repo": None,
+        "pr": None,
+        "config": None,
+        "company_config": None,
+        "output": None,
+        "no_post": False,
+        "project_root": ".",
+    }
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg == "--no-post":
+            values["no_post"] = True
+            continue
+
+        flag, has_value, value = arg.partition("=")
+        dest = _VALUE_FLAGS.get(flag)
+        if dest is None:
+            return None
+        if not has_value:
+            if i >= len(argv) or argv[i].startswith("-"):
+                return None
+            value = argv[i]
+            i += 1
+
+        # argparse applies type/choices to every occurrence, not just the last one
+        if dest == "pr":
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        elif dest == "platform" and value not in ("github", "gitlab"):
+            return None
+        values[dest] = value
+
+    if values["repo"] is None or values["pr"] is None:
+        return None
+
+    return SimpleNamespace(**values)
+
+
+def main():
+    """Main entry point for AI Code Review CLI."""
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
+
+    # Heavy imports (platform SDKs, orchestrator, analyzers) are deferred until after
+    # argument parsing so --help, --version and usage errors return immediately
+    from .config_manager import ConfigManager
+    from .orchestrator import ReviewOrchestrator
+    from .platform import create_platform, create_reporter, detect_platform, load_platform_config
 
     # Auto-detect or use specified platform
     platform = args.platform or detect_platform()
     print(f"Platform: {platform}")
 
-    # Validate environment (API keys and tools)
-    platform_token, anthropic_key = validate_environment(platform)
+    # Validate environment (API keys; Claude Code CLI is checked below)
+    platform_token, anthropic_key = validate_environment(platform, check_claude=False)
+
+    # Probe the Claude Code CLI in the background so a cold `claude --version`
+    # overlaps with config loading and the platform API calls. Submitted only once
+    # the token checks pass, so a failed validation exits without waiting on it
+    executor = ThreadPoolExecutor(max_workers=1)
+    claude_future = executor.submit(_probe_claude)
+    executor.shutdown(wait=False)
 
     try:
         # Load configuration
         print("\nLoading configuration...")
         config_manager = ConfigManager(args.project_root)
-        config = config_manager.load_all_configs(
+        config = config_manager.load_all_configs_cached(
             project_config_path=args.config, company_config_source=args.company_config
         )
 
@@ -156,6 +389,12 @@ def main():
         print(f"Languages: {', '.join(pr_context.detected_languages)}")
         print(f"Change types: {', '.join([ct.value for ct in pr_context.change_types])}")
 
+        # The AI reviews need the Claude Code CLI: collect the background check
+        claude_version, claude_error = claude_future.result()
+        if claude_error:
+            _exit_with_errors([claude_error])
+        print(f"Claude Code CLI found: {claude_version}")
+
         # Run review pipeline
         print("\nRunning review pipeline...")
         orchestrator = ReviewOrchestrator(config, args.project_root)
@@ -163,18 +402,17 @@ def main():
 
         # Save results to file if requested
         if args.output:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path = args.output
+            _ensure_parent(output_path)
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(results.to_dict(), f, indent=2)
+            _write_json(output_path, results.to_dict())
 
             print(f"\nResults saved to: {output_path}")
 
         # Post to platform
         if not args.no_post:
             # Get model from config (optional)
-            anthropic_model = config.get("anthropic", {}).get("model")
+            anthropic_model = (config.get("anthropic") or _EMPTY_SECTION).get("model")
 
             # Load platform config
             platform_config = load_platform_config(config)
@@ -190,9 +428,7 @@ def main():
 
         # Generate summary
         summary = orchestrator.generate_summary(results)
-        print("\n" + "=" * 80)
-        print(summary)
-        print("=" * 80)
+        _print_banner(summary)
 
         # Exit with error code if blocking
         if results.should_block:
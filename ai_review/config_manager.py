@@ -2,14 +2,55 @@
 Configuration manager for multi-level configuration loading and merging.
 """
 
+import functools
 import json
 import os
+import re
+from collections.abc import Mapping
+from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import IO, Any, Literal, overload
 
 import requests
 import yaml
-from jsonschema import ValidationError, validate
+from jsonschema import Draft7Validator, validators
+from jsonschema.exceptions import best_match
+
+try:
+    # libyaml-backed loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+# ${VAR_NAME} environment variable references in config values
+_ENV_REF_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _env_ref_value(match: re.Match[str]) -> str:
+    """Substitute an environment variable reference (unset variables become '')."""
+    return os.getenv(match.group(1), "")
+
+
+def _load_yaml(stream: IO[str] | str) -> dict[str, Any]:
+    """Parse a YAML config document (empty documents become {})."""
+    return yaml.load(stream, Loader=SafeLoader) or {}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON or YAML config file; mtime_ns only invalidates the cache entry."""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return _load_yaml(f)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(key: str) -> tuple[str, ...]:
+    """Split a dotted config key; cached on the key string only, not the manager."""
+    return tuple(key.split("."))
 
 
 class ConfigurationError(Exception):
@@ -78,6 +119,15 @@ class ConfigManager:
         },
     }
 
+    # Compiled once; the schema only uses Draft 7 keywords. "object" accepts any
+    # Mapping so read-only views from load_default_config(copy=False) validate too.
+    _CONFIG_VALIDATOR = validators.extend(
+        Draft7Validator,
+        type_checker=Draft7Validator.TYPE_CHECKER.redefine(
+            "object", lambda _checker, instance: isinstance(instance, Mapping)
+        ),
+    )(CONFIG_SCHEMA)
+
     DEFAULT_CONFIG = {
         "review_aspects": [
             {
@@ -133,10 +183,29 @@ class ConfigManager:
         """Initialize configuration manager."""
         self.project_root = Path(project_root)
         self.config: dict[str, Any] = {}
+        self.company_config_failed = False
+
+    @overload
+    def load_default_config(self, copy: Literal[True] = ...) -> dict[str, Any]: ...
+
+    @overload
+    def load_default_config(self, copy: Literal[False]) -> Mapping[str, Any]: ...
 
-    def load_default_config(self) -> dict[str, Any]:
-        """Load built-in default configuration."""
-        return self.DEFAULT_CONFIG.copy()
+    def load_default_config(self, copy: bool = True) -> Mapping[str, Any]:
+        """
+        Load built-in default configuration.
+
+        Args:
+            copy: Return a private deep copy. With False, return a read-only view of
+                the shared defaults instead (no copying; nested values must not be
+                mutated).
+
+        Returns:
+            Default configuration.
+        """
+        if copy:
+            return deepcopy(self.DEFAULT_CONFIG)
+        return MappingProxyType(self.DEFAULT_CONFIG)
 
     def load_project_config(self, path: str | None = None) -> dict[str, Any]:
         """
@@ -149,35 +218,56 @@ class ConfigManager:
             Project configuration dictionary.
         """
         if path is None:
-            # Try standard locations (supports both GitHub and GitLab)
-            possible_paths = [
-                # GitHub convention
-                self.project_root / ".github" / "ai-review-config.yml",
-                self.project_root / ".github" / "ai-review-config.yaml",
-                # GitLab convention
-                self.project_root / ".gitlab" / "ai-review-config.yml",
-                self.project_root / ".gitlab" / "ai-review-config.yaml",
-                # Root level (platform-agnostic)
-                self.project_root / "ai-review-config.yml",
-                self.project_root / "ai-review-config.yaml",
-            ]
-
-            for config_path in possible_paths:
-                if config_path.exists():
-                    path = str(config_path)
-                    break
-
-        if path is None or not Path(path).exists():
+            path = self._find_project_config()
+        if path is None:
             return {}
 
+        # One stat both checks existence and keys the parse cache
         try:
-            with open(path, encoding="utf-8") as f:
-                if path.endswith(".json"):
-                    return json.load(f)
-                return yaml.safe_load(f) or {}
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return {}
+
+        try:
+            config = _parse_config_file(path, mtime_ns)
         except Exception as e:
             raise ConfigurationError(f"Failed to load project config from {path}: {e}") from e
 
+        # The parsed document is shared by the cache; hand out a private copy
+        return deepcopy(config) if config else {}
+
+    def load_project_config_stream(self, stream: IO[str] | str) -> dict[str, Any]:
+        """
+        Parse project-level YAML configuration from an open stream or string.
+
+        Args:
+            stream: File-like object (or string) containing YAML.
+
+        Returns:
+            Project configuration dictionary (empty for an empty document).
+        """
+        return _load_yaml(stream)
+
+    def _find_project_config(self) -> str | None:
+        """Return the first existing project config in the standard locations."""
+        # Try standard locations (supports both GitHub and GitLab)
+        possible_paths = [
+            # GitHub convention
+            self.project_root / ".github" / "ai-review-config.yml",
+            self.project_root / ".github" / "ai-review-config.yaml",
+            # GitLab convention
+            self.project_root / ".gitlab" / "ai-review-config.yml",
+            self.project_root / ".gitlab" / "ai-review-config.yaml",
+            # Root level (platform-agnostic)
+            self.project_root / "ai-review-config.yml",
+            self.project_root / "ai-review-config.yaml",
+        ]
+
+        for config_path in possible_paths:
+            if config_path.exists():
+                return str(config_path)
+        return None
+
     def load_company_config(self, source: str | None = None) -> dict[str, Any]:
         """
         Load company-level configuration from external source.
@@ -187,8 +277,10 @@ class ConfigManager:
                    Supports: github://, https://, file://
 
         Returns:
-            Company configuration dictionary.
+            Company configuration dictionary. On failure a warning is printed, {} is
+            returned and company_config_failed is set.
         """
+        self.company_config_failed = False
         if not source:
             return {}
 
@@ -200,12 +292,13 @@ class ConfigManager:
             elif source.startswith("file://"):
                 file_path = source.replace("file://", "")
                 with open(file_path, encoding="utf-8") as f:
-                    return yaml.safe_load(f) or {}
+                    return _load_yaml(f)
             # Assume it's a file path
             with open(source, encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+                return _load_yaml(f)
         except Exception as e:
             print(f"Warning: Failed to load company config from {source}: {e}")
+            self.company_config_failed = True
             return {}
 
     def _fetch_from_github(self, source: str) -> dict[str, Any]:
@@ -241,37 +334,58 @@ class ConfigManager:
         if url.endswith(".json"):
             return json.loads(content)
         else:
-            return yaml.safe_load(content) or {}
+            return _load_yaml(content)
 
-    def merge_configs(self, *configs: dict[str, Any]) -> dict[str, Any]:
+    def merge_configs(self, *configs: Mapping[str, Any]) -> dict[str, Any]:
         """
         Merge multiple configuration dictionaries with proper precedence.
         Later configs override earlier ones.
 
+        Only dicts on paths an override touches are copied; untouched subtrees are
+        shared with the inputs, which are never mutated.
+
         Args:
             *configs: Configuration dictionaries to merge.
 
         Returns:
             Merged configuration.
         """
-        merged = {}
-
+        # Fold every layer into one accumulator; each nested dict is copied at most once
+        merged: dict[str, Any] = {}
+        owned = {id(merged)}
         for config in configs:
-            merged = self._deep_merge(merged, config)
+            self._deep_merge_into(merged, config, owned)
 
         return merged
 
-    def _deep_merge(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    def _deep_merge(self, base: dict[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
         """Deep merge two dictionaries."""
         result = base.copy()
+        self._deep_merge_into(result, override, {id(result)})
+        return result
 
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+    def _deep_merge_into(
+        self, target: dict[str, Any], override: Mapping[str, Any], owned: set[int]
+    ) -> None:
+        """
+        Merge override into target in place.
 
-        return result
+        owned holds the ids of dicts created by this merge. Any other nested dict
+        belongs to an input, so it is copied before being written to (copy-on-write).
+        """
+        # Iterative worklist instead of recursion
+        stack = [(target, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    if id(current) not in owned:
+                        target[key] = current = current.copy()
+                        owned.add(id(current))
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
     def validate_config(self, config: dict[str, Any]) -> None:
         """
@@ -283,10 +397,9 @@ class ConfigManager:
         Raises:
             ConfigurationError: If configuration is invalid.
         """
-        try:
-            validate(instance=config, schema=self.CONFIG_SCHEMA)
-        except ValidationError as e:
-            raise ConfigurationError(f"Configuration validation failed: {e.message}") from e
+        error = best_match(self._CONFIG_VALIDATOR.iter_errors(config))
+        if error is not None:
+            raise ConfigurationError(f"Configuration validation failed: {error.message}")
 
     def load_all_configs(
         self, project_config_path: str | None = None, company_config_source: str | None = None
@@ -301,7 +414,8 @@ class ConfigManager:
         Returns:
             Final merged configuration.
         """
-        # Load all levels
+        # Load all levels; the merged result goes to callers that may mutate it, and
+        # untouched subtrees are shared with the defaults, so merge from a private copy
         default_config = self.load_default_config()
         company_config = self.load_company_config(company_config_source)
         project_config = self.load_project_config(project_config_path)
@@ -315,16 +429,60 @@ class ConfigManager:
         except ConfigurationError as e:
             print(f"Warning: Configuration validation failed: {e}")
             # Use defaults for safety
-            self.config = default_config
+            self.config = self.load_default_config()
 
         return self.config
 
+    def load_all_configs_cached(
+        self, project_config_path: str | None = None, company_config_source: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Memoized variant of load_all_configs for repeated in-process invocations.
+
+        The cache is keyed by project root, config sources and the mtimes of the
+        project config and a file-based company config, so editing either file is
+        picked up. A remote company config is fetched once per process; call
+        invalidate_cache() to force a reload. A load whose company config failed is
+        never cached.
+
+        Returns:
+            Final merged configuration (a private copy, safe to mutate).
+        """
+        company_path = None
+        if company_config_source and not company_config_source.startswith(
+            ("github://", "http://", "https://")
+        ):
+            company_path = company_config_source.replace("file://", "")
+
+        key = (
+            str(self.project_root),
+            project_config_path,
+            company_config_source,
+            _file_mtime(project_config_path or self._find_project_config()),
+            _file_mtime(company_path),
+        )
+        cached = _CONFIG_CACHE.get(key)
+        if cached is None:
+            cached = self.load_all_configs(project_config_path, company_config_source)
+            if not self.company_config_failed:
+                if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+                    _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)), None)
+                _CONFIG_CACHE[key] = cached
+
+        # Hand out a copy on both paths so callers can't mutate the cache entry
+        self.config = deepcopy(cached)
+        return self.config
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop configurations memoized by load_all_configs_cached."""
+        _CONFIG_CACHE.clear()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key."""
-        keys = key.split(".")
         value = self.config
 
-        for k in keys:
+        for k in _split_path(key):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
@@ -345,27 +503,46 @@ class ConfigManager:
         Returns:
             Configuration with resolved references.
         """
-        resolved = {}
-
-        for key, value in config.items():
-            if isinstance(value, str):
-                # Resolve environment variable references
-                if "${" in value:
-                    import re
-
-                    matches = re.findall(r"\$\{([^}]+)\}", value)
-                    for match in matches:
-                        env_value = os.getenv(match, "")
-                        value = value.replace(f"${{{match}}}", env_value)
-                resolved[key] = value
-            elif isinstance(value, dict):
-                resolved[key] = self.resolve_config_references(value)
-            elif isinstance(value, list):
-                resolved[key] = [
-                    self.resolve_config_references(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                resolved[key] = value
+        resolved: dict[str, Any] = {}
+
+        # Walk nested dicts with an explicit stack instead of recursing
+        stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(config, resolved)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, str):
+                    # Resolve environment variable references
+                    if "${" in value:
+                        value = _ENV_REF_RE.sub(_env_ref_value, value)
+                    target[key] = value
+                elif isinstance(value, dict):
+                    target[key] = child = {}
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    items = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            child = {}
+                            stack.append((item, child))
+                            item = child
+                        items.append(item)
+                    target[key] = items
+                else:
+                    target[key] = value
 
         return resolved
+
+
+# Merged configs memoized by ConfigManager.load_all_configs_cached (oldest evicted first)
+_CONFIG_CACHE_SIZE = 8
+_CONFIG_CACHE: dict[tuple, dict[str, Any]] = {}
+
+
+def _file_mtime(path: str | Path | None) -> float | None:
+    """Return the mtime of path, or None if there is no such file."""
+    if not path:
+        return None
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
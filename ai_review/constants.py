@@ -0,0 +1,106 @@
+"""
+Shared lookup tables for PR/MR change detection.
+
+Used by both platform implementations and the legacy PRContextBuilder.
+"""
+
+import re
+
+LANGUAGE_EXTENSIONS = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+    ".cs": "csharp",
+    ".cpp": "cpp",
+    ".c": "c",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".sh": "shell",
+    ".yml": "yaml",
+    ".yaml": "yaml",
+    ".json": "json",
+    ".md": "markdown",
+    ".xml": "xml",
+    ".gradle": "gradle",
+    ".properties": "properties",
+}
+
+DEPENDENCY_FILES = {
+    # Python dependency files
+    "requirements.txt": "python",
+    "requirements-dev.txt": "python",
+    "requirements.in": "python",
+    "pyproject.toml": "python",  # UV, Poetry, PDM, Hatch
+    "poetry.lock": "python",
+    "uv.lock": "python",
+    "Pipfile": "python",
+    "Pipfile.lock": "python",
+    "setup.py": "python",
+    "setup.cfg": "python",
+    # JavaScript/TypeScript
+    "package.json": "javascript",
+    "package-lock.json": "javascript",
+    "yarn.lock": "javascript",
+    "pnpm-lock.yaml": "javascript",
+    "bun.lockb": "javascript",
+    # Java
+    "pom.xml": "java",
+    "build.gradle": "java",
+    "build.gradle.kts": "java",
+    "gradle.properties": "java",
+    # Other languages
+    "go.mod": "go",
+    "go.sum": "go",
+    "Cargo.toml": "rust",
+    "Cargo.lock": "rust",
+    "Gemfile": "ruby",
+    "Gemfile.lock": "ruby",
+    "composer.json": "php",
+    "composer.lock": "php",
+}
+
+# Literal substrings (lowercase) that any security pattern match must contain.
+# Checked with plain ``in`` before running the regex so diffs without any
+# candidate skip the regex pass entirely.
+SECURITY_LITERALS = (
+    "password",
+    "secret",
+    "api",
+    "token",
+    "auth",
+    "eval",
+    "exec",
+    "subprocess",
+    "os.system",
+    "innerhtml",
+    "md5",
+    "sha1",
+)
+
+# Applied to lowercased diff text, so the alternatives are lowercase too
+SECURITY_RE = re.compile(
+    r"(password|secret|api[_-]?key|token|auth)"
+    r"|eval\s*\("
+    r"|exec\s*\("
+    r"|(subprocess|os\.system)"
+    r"|(innerhtml|dangerouslysetinnerhtml)"
+    r"|(md5|sha1)\s*\("
+)
+
+# Same idea for breaking changes: a match needs one of these (lowercase) literals.
+BREAKING_LITERALS = ("def", "function", "class", "export", "breaking change", "!:")
+
+# Applied to lowercased diff text, so no IGNORECASE (avoids per-char case folding)
+BREAKING_RE = re.compile(
+    r"^-\s*(?:def|function|class|export)\s+\w+|breaking change|!:",
+    re.MULTILINE,
+)
@@ -45,9 +45,18 @@ class ChangeType(str, Enum):
     DOCUMENTATION = "documentation"
 
 
-@dataclass
+# Member -> value tables for serialization (a dict lookup beats the enum .value property)
+_SEVERITY_VALUES = {s: s.value for s in Severity}
+_CATEGORY_VALUES = {c: c.value for c in FindingCategory}
+
+
+@dataclass(frozen=True, slots=True)
 class Finding:
-    """Represents a single code review finding."""
+    """
+    Represents a single code review finding.
+
+    Findings are immutable; use dataclasses.replace() to derive a modified copy.
+    """
 
     file_path: str
     line_number: int | None
@@ -67,8 +76,8 @@ class Finding:
         return {
             "file_path": self.file_path,
             "line_number": self.line_number,
-            "severity": self.severity.value,
-            "category": self.category.value,
+            "severity": _SEVERITY_VALUES[self.severity],
+            "category": _CATEGORY_VALUES[self.category],
             "message": self.message,
             "suggestion": self.suggestion,
             "tool": self.tool,
@@ -78,9 +87,9 @@ class Finding:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileChange:
-    """Represents a file change in a PR."""
+    """Represents a file change in a PR (immutable once fetched)."""
 
     path: str
     status: str  # added, modified, deleted, renamed
@@ -91,7 +100,7 @@ class FileChange:
     old_path: str | None = None  # For renamed files
 
 
-@dataclass
+@dataclass(slots=True)
 class PRContext:
     """Context information about a Pull Request."""
 
@@ -108,7 +117,7 @@ class PRContext:
     change_types: list[ChangeType] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Result from a single review aspect."""
 
@@ -120,7 +129,7 @@ class ReviewResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     """Performance and cost metrics for review pipeline."""
 
@@ -163,7 +172,7 @@ class Metrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedResults:
     """Aggregated results from all review aspects."""
 
@@ -211,7 +220,7 @@ class AggregatedResults:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyChange:
     """Represents a dependency change."""
 
@@ -225,7 +234,7 @@ class DependencyChange:
     vulnerability_details: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExistingComment:
     """Represents an existing inline comment on a PR/MR.
 
@@ -3,7 +3,9 @@ Orchestrator - Coordinates execution of all review aspects.
 """
 
 import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from typing import Any
 
 from .analyzers.java_analyzer import JavaAnalyzer
@@ -481,8 +483,7 @@ class ReviewOrchestrator:
                 findings.extend(analyzer.run_analysis(changed_file_paths))
 
         # Add aspect tracking to all classical findings
-        for finding in findings:
-            finding.aspect = aspect_name
+        findings = [replace(finding, aspect=aspect_name) for finding in findings]
 
         # Filter findings to only include lines changed in the PR (if enabled)
         if self.config.get("filtering", {}).get("only_changed_lines", True):
@@ -698,14 +699,10 @@ class ReviewOrchestrator:
 
         # Group by file only (not category) to catch cross-category duplicates
         # Example: SQL injection reported as both "security" AND "architecture" should merge
-        file_groups: dict[str, list[Finding]] = {}
+        file_groups: defaultdict[str, list[Finding]] = defaultdict(list)
 
         for finding in findings:
-            group_key = finding.file_path
-
-            if group_key not in file_groups:
-                file_groups[group_key] = []
-            file_groups[group_key].append(finding)
+            file_groups[finding.file_path].append(finding)
 
         # Process each group with AI deduplication
         deduplicated = []
@@ -9,6 +9,14 @@ import os
 from github import Github
 from github.PullRequest import PullRequest
 
+from ..constants import (
+    BREAKING_LITERALS,
+    BREAKING_RE,
+    DEPENDENCY_FILES,
+    LANGUAGE_EXTENSIONS,
+    SECURITY_LITERALS,
+    SECURITY_RE,
+)
 from ..models import (
     AggregatedResults,
     ChangeType,
@@ -24,68 +32,9 @@ from .base import CodeReviewPlatform, PlatformReporter
 class GitHubPlatform(CodeReviewPlatform):
     """GitHub API implementation of CodeReviewPlatform."""
 
-    # Language and dependency file detection (reused from pr_context.py)
-    LANGUAGE_EXTENSIONS = {
-        ".py": "python",
-        ".js": "javascript",
-        ".jsx": "javascript",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".java": "java",
-        ".kt": "kotlin",
-        ".kts": "kotlin",
-        ".go": "go",
-        ".rs": "rust",
-        ".rb": "ruby",
-        ".php": "php",
-        ".cs": "csharp",
-        ".cpp": "cpp",
-        ".c": "c",
-        ".h": "c",
-        ".hpp": "cpp",
-        ".sh": "shell",
-        ".yml": "yaml",
-        ".yaml": "yaml",
-        ".json": "json",
-        ".md": "markdown",
-        ".xml": "xml",
-        ".gradle": "gradle",
-        ".properties": "properties",
-    }
-
-    DEPENDENCY_FILES = {
-        # Python
-        "requirements.txt": "python",
-        "requirements-dev.txt": "python",
-        "requirements.in": "python",
-        "pyproject.toml": "python",
-        "poetry.lock": "python",
-        "uv.lock": "python",
-        "Pipfile": "python",
-        "Pipfile.lock": "python",
-        "setup.py": "python",
-        "setup.cfg": "python",
-        # JavaScript/TypeScript
-        "package.json": "javascript",
-        "package-lock.json": "javascript",
-        "yarn.lock": "javascript",
-        "pnpm-lock.yaml": "javascript",
-        "bun.lockb": "javascript",
-        # Java
-        "pom.xml": "java",
-        "build.gradle": "java",
-        "build.gradle.kts": "java",
-        "gradle.properties": "java",
-        # Other
-        "go.mod": "go",
-        "go.sum": "go",
-        "Cargo.toml": "rust",
-        "Cargo.lock": "rust",
-        "Gemfile": "ruby",
-        "Gemfile.lock": "ruby",
-        "composer.json": "php",
-        "composer.lock": "php",
-    }
+    # Language and dependency file detection (shared with GitLab and pr_context.py)
+    LANGUAGE_EXTENSIONS = LANGUAGE_EXTENSIONS
+    DEPENDENCY_FILES = DEPENDENCY_FILES
 
     def __init__(self, github_token: str | None = None):
         """
@@ -98,7 +47,9 @@ class GitHubPlatform(CodeReviewPlatform):
         if not token:
             raise ValueError("GitHub token is required (GITHUB_TOKEN environment variable)")
 
-        self.github = Github(token)
+        # Page at GitHub's maximum (100) instead of PyGithub's default 30, so
+        # large PRs need a third of the file-list requests
+        self.github = Github(token, per_page=100)
         self._pr_cache = {}  # Cache PR objects to avoid repeated API calls
 
     def get_platform_name(self) -> str:
@@ -247,11 +198,7 @@ class GitHubPlatform(CodeReviewPlatform):
                 # Look for our marker or known patterns
                 is_ai_comment = (
                     "<!-- AI-REVIEW:" in body
-                    or body.startswith("### 🔴")
-                    or body.startswith("### 🟠")
-                    or body.startswith("### 🟡")
-                    or body.startswith("### 🔵")
-                    or body.startswith("### ⚪")
+                    or body.startswith(("### 🔴", "### 🟠", "### 🟡", "### 🔵", "### ⚪"))
                     or "🔒 **" in body
                     or "⚡ **" in body
                     or "🏗️ **" in body
@@ -418,11 +365,12 @@ class GitHubPlatform(CodeReviewPlatform):
         if self._has_documentation_changes(changed_files):
             change_types.add(ChangeType.DOCUMENTATION)
 
-        # Analyze diff patterns
-        if self._has_security_patterns(diff):
+        # Analyze diff patterns (lowercased once for both checks)
+        diff_lower = diff.lower()
+        if self._has_security_patterns(diff_lower):
             change_types.add(ChangeType.SECURITY_RISK)
 
-        if self._has_breaking_change_patterns(diff):
+        if self._has_breaking_change_patterns(diff_lower):
             change_types.add(ChangeType.BREAKING_CHANGE)
 
         # Default to feature
@@ -472,39 +420,17 @@ class GitHubPlatform(CodeReviewPlatform):
                     return True
         return False
 
-    def _has_security_patterns(self, diff: str) -> bool:
-        """Check for security-sensitive patterns in diff."""
-        import re
-
-        security_patterns = [
-            r"(password|secret|api[_-]?key|token|auth)",
-            r"eval\s*\(",
-            r"exec\s*\(",
-            r"(subprocess|os\.system)",
-            r"(innerHTML|dangerouslySetInnerHTML)",
-            r"(md5|sha1)\s*\(",
-        ]
-
-        diff_lower = diff.lower()
-        for pattern in security_patterns:
-            if re.search(pattern, diff_lower):
-                return True
-        return False
-
-    def _has_breaking_change_patterns(self, diff: str) -> bool:
-        """Check for potential breaking changes in diff."""
-        import re
-
-        breaking_patterns = [
-            r"^\-\s*(def|function|class|export)\s+\w+",
-            r"BREAKING CHANGE",
-            r"!:",
-        ]
+    def _has_security_patterns(self, diff_lower: str) -> bool:
+        """Check lowercased diff text for security-sensitive patterns."""
+        if not any(literal in diff_lower for literal in SECURITY_LITERALS):
+            return False
+        return SECURITY_RE.search(diff_lower) is not None
 
-        for pattern in breaking_patterns:
-            if re.search(pattern, diff, re.MULTILINE | re.IGNORECASE):
-                return True
-        return False
+    def _has_breaking_change_patterns(self, diff_lower: str) -> bool:
+        """Check lowercased diff text for potential breaking changes."""
+        if not any(literal in diff_lower for literal in BREAKING_LITERALS):
+            return False
+        return BREAKING_RE.search(diff_lower) is not None
 
     def _normalize_file_path(self, file_path: str, project_identifier: str) -> str:
         """
@@ -8,6 +8,14 @@ import os
 
 import gitlab
 
+from ..constants import (
+    BREAKING_LITERALS,
+    BREAKING_RE,
+    DEPENDENCY_FILES,
+    LANGUAGE_EXTENSIONS,
+    SECURITY_LITERALS,
+    SECURITY_RE,
+)
 from ..models import (
     AggregatedResults,
     ChangeType,
@@ -18,10 +26,38 @@ from ..models import (
 )
 from .base import CodeReviewPlatform, PlatformReporter
 
+# Retry budget for comment writes (python-gitlab's default is 10)
+_WRITE_MAX_RETRIES = 3
+
+# Path classification tables (matched against the lowercased path)
+_TEST_SUFFIXES = (
+    "_test.py",
+    ".test.js",
+    ".test.ts",
+    ".test.jsx",
+    ".test.tsx",
+    ".spec.js",
+    ".spec.ts",
+    ".spec.jsx",
+    ".spec.tsx",
+)
+_TEST_DIR_MARKERS = ("test/", "tests/", "__tests__/")
+_DOC_SUFFIXES = (".md", ".rst")
+_DOC_SUBSTRINGS = ("doc/", "docs/", "readme", "changelog")
+
+
+def _count_line_changes(patch: str) -> tuple[int, int]:
+    """Count added and removed lines in a unified diff patch."""
+    if not patch:
+        return 0, 0
+    return patch.count("\n+"), patch.count("\n-")
+
 
 class GitLabPlatform(CodeReviewPlatform):
     """GitLab API implementation of CodeReviewPlatform."""
 
+    _DEP_BASENAMES = frozenset(DEPENDENCY_FILES)
+
     def __init__(self, gitlab_token: str | None = None):
         """
         Initialize GitLab platform client.
@@ -39,8 +75,12 @@ class GitLabPlatform(CodeReviewPlatform):
         # Get GitLab URL (supports self-hosted instances)
         gitlab_url = os.getenv("CI_SERVER_URL", "https://gitlab.com")
 
-        self.gl = gitlab.Gitlab(gitlab_url, private_token=token)
+        # python-gitlab retries 429s (honoring Retry-After) by default; also retry
+        # 5xx/connection errors with backoff instead of failing the whole review
+        self.gl = gitlab.Gitlab(gitlab_url, private_token=token, retry_transient_errors=True)
+        self._project_cache = {}  # Cache project objects
         self._mr_cache = {}  # Cache MR objects
+        self._context_cache: dict[str, tuple[str, PRContext]] = {}  # key -> (updated_at, context)
 
     def get_platform_name(self) -> str:
         """Get platform name."""
@@ -57,13 +97,18 @@ class GitLabPlatform(CodeReviewPlatform):
         Returns:
             PRContext object with MR information
         """
-        project = self.gl.projects.get(project_identifier)
+        project = self._get_project(project_identifier)
         mr = project.mergerequests.get(mr_iid)
 
         # Cache MR for later use
         cache_key = f"{project_identifier}!{mr_iid}"
         self._mr_cache[cache_key] = (project, mr)
 
+        # Reuse the previously built context if the MR has not changed since
+        cached = self._context_cache.get(cache_key)
+        if cached and cached[0] == mr.updated_at:
+            return cached[1]
+
         # Build context
         metadata = {
             "title": mr.title,
@@ -77,9 +122,9 @@ class GitLabPlatform(CodeReviewPlatform):
         changed_files = self._get_changed_files(mr)
         diff = self._get_mr_diff(changed_files)
         detected_languages = self._detect_languages(changed_files)
-        change_types = self._detect_change_types(changed_files, diff)
+        change_types = self._detect_change_types(changed_files)
 
-        return PRContext(
+        context = PRContext(
             pr_number=mr_iid,
             title=metadata["title"],
             description=metadata["description"],
@@ -92,6 +137,8 @@ class GitLabPlatform(CodeReviewPlatform):
             detected_languages=detected_languages,
             change_types=change_types,
         )
+        self._context_cache[cache_key] = (mr.updated_at, context)
+        return context
 
     def post_summary_comment(self, project_identifier: str, mr_iid: int, comment: str) -> None:
         """
@@ -104,8 +151,10 @@ class GitLabPlatform(CodeReviewPlatform):
         """
         project, mr = self._get_mr(project_identifier, mr_iid)
 
-        # Check for existing note (look for our marker)
-        notes = mr.notes.list(get_all=True)
+        # Check for existing note (look for our marker). Our note is edited on every
+        # run, so newest-updated first usually finds it on the first page; the
+        # iterator only fetches further pages if it has not been found yet.
+        notes = mr.notes.list(order_by="updated_at", sort="desc", per_page=20, iterator=True)
         existing_note = None
         for note in notes:
             if note.body.startswith("# 🤖 AI Code Review"):
@@ -115,10 +164,10 @@ class GitLabPlatform(CodeReviewPlatform):
         if existing_note:
             # Update existing note
             existing_note.body = comment
-            existing_note.save()
+            existing_note.save(max_retries=_WRITE_MAX_RETRIES)
         else:
             # Create new note
-            mr.notes.create({"body": comment})
+            mr.notes.create({"body": comment}, max_retries=_WRITE_MAX_RETRIES)
 
     def post_inline_comments(
         self,
@@ -164,7 +213,7 @@ class GitLabPlatform(CodeReviewPlatform):
                     },
                 }
 
-                mr.discussions.create(discussion_data)
+                mr.discussions.create(discussion_data, max_retries=_WRITE_MAX_RETRIES)
             except Exception as e:
                 print(
                     f"  ⚠️ Failed to post discussion on {finding.file_path}:{finding.line_number}: {e}"
@@ -198,11 +247,7 @@ class GitLabPlatform(CodeReviewPlatform):
                 # Check if this is an AI review comment
                 is_ai_comment = (
                     "<!-- AI-REVIEW:" in body
-                    or body.startswith("### 🔴")
-                    or body.startswith("### 🟠")
-                    or body.startswith("### 🟡")
-                    or body.startswith("### 🔵")
-                    or body.startswith("### ⚪")
+                    or body.startswith(("### 🔴", "### 🟠", "### 🟡", "### 🔵", "### ⚪"))
                     or "🔒 **" in body
                     or "⚡ **" in body
                     or "🏗️ **" in body
@@ -255,7 +300,7 @@ class GitLabPlatform(CodeReviewPlatform):
                 # Update the note
                 note = mr.notes.get(note_id)
                 note.body = new_body
-                note.save()
+                note.save(max_retries=_WRITE_MAX_RETRIES)
                 return True
             return False
         except Exception as e:
@@ -303,7 +348,7 @@ class GitLabPlatform(CodeReviewPlatform):
             description: Status description
             context: Status check name
         """
-        project = self.gl.projects.get(project_identifier)
+        project = self._get_project(project_identifier)
         commit = project.commits.get(commit_sha)
 
         # Map GitHub-style states to GitLab states
@@ -329,22 +374,40 @@ class GitLabPlatform(CodeReviewPlatform):
             return self._mr_cache[cache_key]
 
         # Fetch and cache
-        project = self.gl.projects.get(project_identifier)
+        project = self._get_project(project_identifier)
         mr = project.mergerequests.get(mr_iid)
         self._mr_cache[cache_key] = (project, mr)
         return project, mr
 
+    def _get_project(self, project_identifier: str):
+        """Get project object from cache or fetch it."""
+        if project_identifier not in self._project_cache:
+            self._project_cache[project_identifier] = self.gl.projects.get(project_identifier)
+        return self._project_cache[project_identifier]
+
     def _get_changed_files(self, mr) -> list[FileChange]:
         """Extract changed files from MR."""
         changed_files = []
 
         try:
-            changes_data = mr.changes()
+            # Raw diffs avoid GitLab's per-file diff size truncation
+            changes_data = mr.changes(access_raw_diffs=True)
             changes_list = changes_data.get("changes", [])
         except Exception as e:
             print(f"  ⚠️ Could not fetch MR changes: {e}")
             return changed_files
 
+        # /changes caps the number of files; fall back to the paginated /diffs API
+        if changes_data.get("overflow"):
+            try:
+                changes_list = self._list_mr_diffs(mr)
+            except Exception as e:
+                # Older GitLab or missing permissions: review the capped list instead
+                print(
+                    f"  ⚠️ Could not page MR diffs ({e}); "
+                    f"reviewing the first {len(changes_list)} files only"
+                )
+
         for change in changes_list:
             # Determine status
             if change.get("new_file"):
@@ -358,8 +421,7 @@ class GitLabPlatform(CodeReviewPlatform):
 
             # Calculate additions/deletions from diff
             diff_text = change.get("diff", "")
-            additions = diff_text.count("\n+") if diff_text else 0
-            deletions = diff_text.count("\n-") if diff_text else 0
+            additions, deletions = _count_line_changes(diff_text)
 
             file_change = FileChange(
                 path=change.get("new_path", change.get("old_path", "")),
@@ -374,37 +436,45 @@ class GitLabPlatform(CodeReviewPlatform):
 
         return changed_files
 
+    def _list_mr_diffs(self, mr) -> list[dict]:
+        """Fetch all MR file diffs from the paginated diffs endpoint (100 per page)."""
+        path = f"{mr.manager.path}/{mr.encoded_id}/diffs"
+        pages = self.gl.http_list(path, per_page=100, iterator=True)
+        diffs = list(pages)
+        print(f"  ✓ Fetched {len(diffs)} file diffs in {pages.total_pages or 1} page(s)")
+        return diffs
+
     def _get_mr_diff(self, changed_files: list[FileChange]) -> str:
         """Build unified diff string from changed files."""
-        diff_parts = []
-
-        for file_change in changed_files:
-            if file_change.patch:
-                diff_parts.append(f"--- {file_change.path}")
-                diff_parts.append(file_change.patch)
-                diff_parts.append("")
-
-        return "\n".join(diff_parts)
+        return "\n".join(
+            f"--- {file_change.path}\n{file_change.patch}\n"
+            for file_change in changed_files
+            if file_change.patch
+        )
 
     def _detect_languages(self, changed_files: list[FileChange]) -> list[str]:
-        """Detect programming languages (reuse GitHub's logic)."""
-        from .github_platform import GitHubPlatform
-
+        """Detect programming languages from file extensions."""
         languages: set[str] = set()
         for file_change in changed_files:
             path = file_change.path.lower()
-            for ext, lang in GitHubPlatform.LANGUAGE_EXTENSIONS.items():
+            for ext, lang in LANGUAGE_EXTENSIONS.items():
                 if path.endswith(ext):
                     languages.add(lang)
                     break
 
         return sorted(languages)
 
-    def _detect_change_types(self, changed_files: list[FileChange], diff: str) -> list[ChangeType]:
-        """Detect types of changes (reuse GitHub's logic)."""
+    def _detect_change_types(self, changed_files: list[FileChange]) -> list[ChangeType]:
+        """
+        Detect types of changes in the MR.
+
+        Diff patterns are matched per file patch rather than on the joined MR
+        diff, so large MRs never need a lowercased copy of the whole diff.
+        """
 
         change_types: set[ChangeType] = set()
 
+        # Path-based checks first (cheap), diff scans last
         # Check for dependency changes
         if self._has_dependency_changes(changed_files):
             change_types.add(ChangeType.DEPENDENCY_CHANGE)
@@ -418,11 +488,7 @@ class GitLabPlatform(CodeReviewPlatform):
             change_types.add(ChangeType.DOCUMENTATION)
 
         # Analyze diff patterns
-        if self._has_security_patterns(diff):
-            change_types.add(ChangeType.SECURITY_RISK)
-
-        if self._has_breaking_change_patterns(diff):
-            change_types.add(ChangeType.BREAKING_CHANGE)
+        change_types |= self._detect_diff_change_types(changed_files)
 
         # Default to feature
         if not change_types:
@@ -432,80 +498,73 @@ class GitLabPlatform(CodeReviewPlatform):
 
     def _has_dependency_changes(self, changed_files: list[FileChange]) -> bool:
         """Check for dependency file changes."""
-        from .github_platform import GitHubPlatform
-
+        # GitLab paths always use "/", so rpartition gives the basename directly
         for file_change in changed_files:
-            filename = os.path.basename(file_change.path)
-            if filename in GitHubPlatform.DEPENDENCY_FILES:
+            if file_change.path.rpartition("/")[2] in self._DEP_BASENAMES:
                 return True
         return False
 
     def _has_test_changes(self, changed_files: list[FileChange]) -> bool:
         """Check for test file changes."""
-        import re
-
-        test_patterns = [
-            r"test_.*\.py$",
-            r".*_test\.py$",
-            r".*\.test\.(js|ts|jsx|tsx)$",
-            r".*\.spec\.(js|ts|jsx|tsx)$",
-            r"tests?/",
-            r"__tests__/",
-        ]
-
         for file_change in changed_files:
             path = file_change.path.lower()
-            for pattern in test_patterns:
-                if re.search(pattern, path):
-                    return True
+            if path.endswith(_TEST_SUFFIXES) or any(marker in path for marker in _TEST_DIR_MARKERS):
+                return True
+            # test_*.py ("test_" anywhere before the .py suffix)
+            if path.endswith(".py") and "test_" in path[:-3]:
+                return True
         return False
 
     def _has_documentation_changes(self, changed_files: list[FileChange]) -> bool:
         """Check for documentation changes."""
-        import re
+        for file_change in changed_files:
+            path = file_change.path.lower()
+            if path.endswith(_DOC_SUFFIXES) or any(marker in path for marker in _DOC_SUBSTRINGS):
+                return True
+        return False
 
-        doc_patterns = [r"\.md$", r"\.rst$", r"docs?/", r"README", r"CHANGELOG"]
+    def _detect_diff_change_types(self, changed_files: list[FileChange]) -> set[ChangeType]:
+        """
+        Detect security and breaking-change patterns in one pass over the patches.
+
+        Each patch is lowercased once and shared by both checks; the scan stops
+        as soon as both change types have been found.
+        """
+        found: set[ChangeType] = set()
 
         for file_change in changed_files:
-            path = file_change.path
-            for pattern in doc_patterns:
-                if re.search(pattern, path, re.IGNORECASE):
-                    return True
-        return False
+            patch = file_change.patch
+            if not patch:
+                continue
 
-    def _has_security_patterns(self, diff: str) -> bool:
-        """Check for security-sensitive patterns."""
-        import re
-
-        security_patterns = [
-            r"(password|secret|api[_-]?key|token|auth)",
-            r"eval\s*\(",
-            r"exec\s*\(",
-            r"(subprocess|os\.system)",
-            r"(innerHTML|dangerouslySetInnerHTML)",
-            r"(md5|sha1)\s*\(",
-        ]
-
-        diff_lower = diff.lower()
-        for pattern in security_patterns:
-            if re.search(pattern, diff_lower):
-                return True
-        return False
+            patch_lower = patch.lower()
+            if ChangeType.SECURITY_RISK not in found and (
+                self._has_security_patterns(file_change.path.lower())
+                or self._has_security_patterns(patch_lower)
+            ):
+                found.add(ChangeType.SECURITY_RISK)
 
-    def _has_breaking_change_patterns(self, diff: str) -> bool:
-        """Check for breaking change patterns."""
-        import re
+            if ChangeType.BREAKING_CHANGE not in found and self._has_breaking_change_patterns(
+                patch_lower
+            ):
+                found.add(ChangeType.BREAKING_CHANGE)
 
-        breaking_patterns = [
-            r"^\-\s*(def|function|class|export)\s+\w+",
-            r"BREAKING CHANGE",
-            r"!:",
-        ]
+            if len(found) == 2:
+                break
 
-        for pattern in breaking_patterns:
-            if re.search(pattern, diff, re.MULTILINE | re.IGNORECASE):
-                return True
-        return False
+        return found
+
+    def _has_security_patterns(self, text_lower: str) -> bool:
+        """Check lowercased diff text for security-sensitive patterns."""
+        if not any(literal in text_lower for literal in SECURITY_LITERALS):
+            return False
+        return SECURITY_RE.search(text_lower) is not None
+
+    def _has_breaking_change_patterns(self, text_lower: str) -> bool:
+        """Check lowercased diff text for breaking change patterns."""
+        if not any(literal in text_lower for literal in BREAKING_LITERALS):
+            return False
+        return BREAKING_RE.search(text_lower) is not None
 
 
 class GitLabReporter(PlatformReporter):
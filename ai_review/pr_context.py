@@ -2,80 +2,37 @@
 PR Context Builder - Extract and prepare PR information for review.
 """
 
+import math
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Any
 
 from github import Github
 from github.PullRequest import PullRequest
 
+from .constants import (
+    BREAKING_LITERALS,
+    BREAKING_RE,
+    DEPENDENCY_FILES,
+    LANGUAGE_EXTENSIONS,
+    SECURITY_LITERALS,
+    SECURITY_RE,
+)
 from .models import ChangeType, FileChange, PRContext
 
 
 class PRContextBuilder:
     """Builds context information about a Pull Request."""
 
-    LANGUAGE_EXTENSIONS = {
-        ".py": "python",
-        ".js": "javascript",
-        ".jsx": "javascript",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".java": "java",
-        ".kt": "kotlin",
-        ".kts": "kotlin",
-        ".go": "go",
-        ".rs": "rust",
-        ".rb": "ruby",
-        ".php": "php",
-        ".cs": "csharp",
-        ".cpp": "cpp",
-        ".c": "c",
-        ".h": "c",
-        ".hpp": "cpp",
-        ".sh": "shell",
-        ".yml": "yaml",
-        ".yaml": "yaml",
-        ".json": "json",
-        ".md": "markdown",
-        ".xml": "xml",
-        ".gradle": "gradle",
-        ".properties": "properties",
-    }
-
-    DEPENDENCY_FILES = {
-        # Python dependency files
-        "requirements.txt": "python",
-        "requirements-dev.txt": "python",
-        "requirements.in": "python",
-        "pyproject.toml": "python",  # UV, Poetry, PDM, Hatch
-        "poetry.lock": "python",
-        "uv.lock": "python",
-        "Pipfile": "python",
-        "Pipfile.lock": "python",
-        "setup.py": "python",
-        "setup.cfg": "python",
-        # JavaScript/TypeScript
-        "package.json": "javascript",
-        "package-lock.json": "javascript",
-        "yarn.lock": "javascript",
-        "pnpm-lock.yaml": "javascript",
-        "bun.lockb": "javascript",
-        # Java
-        "pom.xml": "java",
-        "build.gradle": "java",
-        "build.gradle.kts": "java",
-        "gradle.properties": "java",
-        # Other languages
-        "go.mod": "go",
-        "go.sum": "go",
-        "Cargo.toml": "rust",
-        "Cargo.lock": "rust",
-        "Gemfile": "ruby",
-        "Gemfile.lock": "ruby",
-        "composer.json": "php",
-        "composer.lock": "php",
-    }
+    LANGUAGE_EXTENSIONS = LANGUAGE_EXTENSIONS
+    DEPENDENCY_FILES = DEPENDENCY_FILES
+
+    # GitHub's maximum page size; PyGithub defaults to 30
+    FILES_PER_PAGE = 100
+    # The pull request files endpoint lists at most this many files
+    MAX_LISTED_FILES = 3000
 
     def __init__(self, github_token: str | None = None):
         """
@@ -88,7 +45,7 @@ class PRContextBuilder:
         if not token:
             raise ValueError("GitHub token is required")
 
-        self.github = Github(token)
+        self.github = Github(token, per_page=self.FILES_PER_PAGE)
 
     def build_context(self, repo_name: str, pr_number: int) -> PRContext:
         """
@@ -101,7 +58,8 @@ class PRContextBuilder:
         Returns:
             PRContext object with all PR information
         """
-        repo = self.github.get_repo(repo_name)
+        # Lazy repo: get_pull only needs its URL, so skip the repository fetch
+        repo = self.github.get_repo(repo_name, lazy=True)
         pr = repo.get_pull(pr_number)
 
         # Get PR metadata
@@ -145,10 +103,23 @@ class PRContextBuilder:
         }
 
     def _get_changed_files(self, pr: PullRequest) -> list[FileChange]:
-        """Get list of changed files with statistics."""
+        """
+        Get list of changed files with statistics.
+
+        The PR reports its changed file count, so the number of pages is known
+        up front and the pages are fetched concurrently instead of one by one.
+        """
+        files = pr.get_files()
+        page_count = max(1, math.ceil(pr.changed_files / self.FILES_PER_PAGE))
+        # Pages past the API's listing limit come back empty; don't request them
+        page_count = min(page_count, self.MAX_LISTED_FILES // self.FILES_PER_PAGE)
+
+        with ThreadPoolExecutor(max_workers=min(4, page_count)) as executor:
+            pages = list(executor.map(files.get_page, range(page_count)))
+
         changed_files = []
 
-        for file in pr.get_files():
+        for file in chain.from_iterable(pages):
             change = FileChange(
                 path=file.filename,
                 status=file.status,
@@ -230,11 +201,12 @@ class PRContextBuilder:
         if self._has_documentation_changes(changed_files):
             change_types.add(ChangeType.DOCUMENTATION)
 
-        # Analyze diff for specific patterns
-        if self._has_security_patterns(diff):
+        # Analyze diff for specific patterns (lowercased once for both checks)
+        diff_lower = diff.lower()
+        if self._has_security_patterns(diff_lower):
             change_types.add(ChangeType.SECURITY_RISK)
 
-        if self._has_breaking_change_patterns(diff):
+        if self._has_breaking_change_patterns(diff_lower):
             change_types.add(ChangeType.BREAKING_CHANGE)
 
         # Default to feature if no specific type detected
@@ -280,35 +252,17 @@ class PRContextBuilder:
                     return True
         return False
 
-    def _has_security_patterns(self, diff: str) -> bool:
-        """Check for security-sensitive patterns in diff."""
-        security_patterns = [
-            r"(password|secret|api[_-]?key|token|auth)",
-            r"eval\s*\(",
-            r"exec\s*\(",
-            r"(subprocess|os\.system)",
-            r"(innerHTML|dangerouslySetInnerHTML)",
-            r"(md5|sha1)\s*\(",  # Weak crypto
-        ]
-
-        diff_lower = diff.lower()
-        for pattern in security_patterns:
-            if re.search(pattern, diff_lower):
-                return True
-        return False
-
-    def _has_breaking_change_patterns(self, diff: str) -> bool:
-        """Check for potential breaking changes in diff."""
-        breaking_patterns = [
-            r"^\-\s*(def|function|class|export)\s+\w+",  # Removed definitions
-            r"BREAKING CHANGE",
-            r"!:",  # Conventional commits breaking change
-        ]
-
-        for pattern in breaking_patterns:
-            if re.search(pattern, diff, re.MULTILINE | re.IGNORECASE):
-                return True
-        return False
+    def _has_security_patterns(self, diff_lower: str) -> bool:
+        """Check lowercased diff text for security-sensitive patterns."""
+        if not any(literal in diff_lower for literal in SECURITY_LITERALS):
+            return False
+        return SECURITY_RE.search(diff_lower) is not None
+
+    def _has_breaking_change_patterns(self, diff_lower: str) -> bool:
+        """Check lowercased diff text for potential breaking changes."""
+        if not any(literal in diff_lower for literal in BREAKING_LITERALS):
+            return False
+        return BREAKING_RE.search(diff_lower) is not None
 
     def calculate_change_impact(self, pr_context: PRContext) -> dict[str, Any]:
         """
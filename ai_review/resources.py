@@ -60,11 +60,16 @@ def get_default_config() -> dict:
     """
     import yaml
 
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader  # type: ignore[assignment]
+
     try:
         config_files = resources.files("ai_review.config")
         config_file = config_files.joinpath("default-config.yml")
         content = config_file.read_text(encoding="utf-8")
-        return yaml.safe_load(content) or {}
+        return yaml.load(content, Loader=SafeLoader) or {}
     except (FileNotFoundError, TypeError):
         # Return minimal default if bundled config not found
         return {
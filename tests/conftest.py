@@ -0,0 +1,78 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from ai_review.config_manager import ConfigManager
+from ai_review.models import (
+    ChangeType,
+    FileChange,
+    Finding,
+    FindingCategory,
+    PRContext,
+    ReviewResult,
+    Severity,
+)
+
+
+@pytest.fixture(scope="session")
+def default_config_cached():
+    """Read-only view of the default configuration, shared by the session."""
+    return ConfigManager().load_default_config(copy=False)
+
+
+@pytest.fixture
+def manager():
+    """Fresh ConfigManager rooted at the current directory."""
+    return ConfigManager()
+
+
+# Read-only model samples, built once per session. Tests that need to mutate
+# a model should construct their own instance.
+
+
+@pytest.fixture(scope="session")
+def sample_finding():
+    """High-severity security finding reported by bandit."""
+    return Finding(
+        file_path="test.py",
+        line_number=10,
+        severity=Severity.HIGH,
+        category=FindingCategory.SECURITY,
+        message="Test message",
+        tool="bandit",
+        rule_id="B608",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_file_change():
+    """Modified Python file."""
+    return FileChange(path="test.py", status="modified", additions=10, deletions=5, changes=15)
+
+
+@pytest.fixture(scope="session")
+def sample_pr_context(sample_file_change):
+    """Bugfix PR touching a single Python file."""
+    return PRContext(
+        pr_number=123,
+        title="Test PR",
+        description="Test description",
+        author="testuser",
+        base_branch="main",
+        head_branch="feature/test",
+        labels=["bug", "high-priority"],
+        changed_files=[sample_file_change],
+        diff="test diff",
+        detected_languages=["python"],
+        change_types=[ChangeType.BUGFIX],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_review_result(sample_finding):
+    """Successful security review with one finding."""
+    return ReviewResult(
+        aspect_name="security", findings=[sample_finding], execution_time=1.0, success=True
+    )
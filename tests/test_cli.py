@@ -0,0 +1,164 @@
+"""
+Tests for the CLI entry point helpers.
+"""
+
+import os
+import stat
+
+import pytest
+
+from ai_review import cli
+from ai_review.config_manager import ConfigManager
+
+
+class TestValidateEnvironment:
+    """Test environment validation."""
+
+    def test_errors_reported_when_stderr_is_captured(self, monkeypatch, capsys):
+        """Test the report still reaches a stderr without a file descriptor."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+        with pytest.raises(SystemExit) as exc_info:
+            cli.validate_environment("github", check_claude=False)
+
+        assert exc_info.value.code == 1
+        err = capsys.readouterr().err
+        assert "ENVIRONMENT VALIDATION FAILED" in err
+        assert "GITHUB_TOKEN environment variable is required" in err
+
+
+class TestMain:
+    """Test the CLI entry point."""
+
+    def test_unhandled_error_exits_with_status_1(self, monkeypatch, capsys):
+        """Test an error in the review run is reported and becomes SystemExit(1)."""
+        monkeypatch.setattr("sys.argv", ["ai-review", "--repo", "o/r", "--pr", "7"])
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+        monkeypatch.setattr(cli, "_probe_claude", lambda: ("1.0.0", None))
+
+        def fail(self, *args, **kwargs):
+            raise RuntimeError("config unavailable")
+
+        monkeypatch.setattr(ConfigManager, "load_all_configs_cached", fail)
+        excepthook = cli.sys.excepthook
+
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main()
+
+        assert exc_info.value.code == 1
+        assert "Error: config unavailable" in capsys.readouterr().err
+        assert cli.sys.excepthook is excepthook
+
+    def test_invalid_environment_exits_before_probing_claude(self, monkeypatch, capsys):
+        """Test missing tokens fail immediately without running `claude --version`."""
+        monkeypatch.setattr("sys.argv", ["ai-review", "--repo", "o/r", "--pr", "7"])
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        probes = []
+        monkeypatch.setattr(cli, "_probe_claude", lambda: probes.append(1))
+
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main()
+
+        assert exc_info.value.code == 1
+        assert "GITHUB_TOKEN environment variable is required" in capsys.readouterr().err
+        assert probes == []
+
+
+class TestClaudeVersionCache:
+    """Test the on-disk cache for `claude --version`."""
+
+    @pytest.fixture
+    def claude_stub(self, tmp_path, monkeypatch):
+        """Stub claude binary that records each invocation, plus a temporary cache path."""
+        calls = tmp_path / "calls"
+        binary = tmp_path / "claude"
+        binary.write_text(f'#!/bin/sh\necho run >> "{calls}"\necho "1.2.3 (Claude Code)"\n')
+        binary.chmod(binary.stat().st_mode | stat.S_IXUSR)
+        monkeypatch.setattr(cli, "_CLAUDE_VERSION_CACHE", str(tmp_path / "cache" / "version"))
+        return binary, calls
+
+    def test_cache_miss_then_hit(self, claude_stub):
+        """Test the binary runs once and the second lookup is served from the cache."""
+        binary, calls = claude_stub
+
+        assert cli._get_claude_version(str(binary)) == "1.2.3 (Claude Code)"
+        assert cli._get_claude_version(str(binary)) == "1.2.3 (Claude Code)"
+        assert calls.read_text().count("run") == 1
+
+    def test_cache_invalidated_when_binary_changes(self, claude_stub):
+        """Test a new mtime on the binary forces a fresh `claude --version`."""
+        binary, calls = claude_stub
+        cli._get_claude_version(str(binary))
+
+        st = binary.stat()
+        os.utime(binary, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        cli._get_claude_version(str(binary))
+
+        assert calls.read_text().count("run") == 2
+
+
+def _parse_with_argparse(argv):
+    """Parse argv with the full argparse parser; None if it rejects the arguments."""
+    try:
+        return vars(cli._build_parser().parse_args(argv))
+    except SystemExit:
+        return None
+
+
+class TestParseArgsFast:
+    """Test the argparse-free fast path against the real parser."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--repo", "o/r", "--pr", "7"],
+            ["--repo=o/r", "--pr=7"],
+            ["--pr", "7", "--repo", "o/r", "--no-post"],
+            ["--repo", "o/r", "--pr", "7", "--platform", "gitlab"],
+            ["--repo", "o/r", "--pr", "7", "--platform=github", "--output", "out/r.json"],
+            ["--repo", "o/r", "--pr", "7", "--config", "c.yml", "--company-config", "x.yml"],
+            ["--repo", "o/r", "--pr", "7", "--project-root", "/src"],
+            ["--repo", "a", "--repo", "b", "--pr", "1", "--pr", "2"],
+            ["--repo", "", "--pr", "7"],
+            ["--repo=--odd", "--pr", "7"],
+            # Rejected or unusual input: the fast path must defer to argparse
+            ["--pr", "o/r", "--pr=7", "--repo=a"],
+            ["--repo", "o/r", "--pr", "x"],
+            ["--repo", "o/r", "--pr", "7", "--platform", "bitbucket"],
+            ["--repo", "o/r", "--pr", "7", "--platform", "bitbucket", "--platform", "github"],
+            ["--repo", "o/r"],
+            ["--pr", "7"],
+            ["--repo", "--pr", "7"],
+            ["--repo", "o/r", "--pr", "-7"],
+            ["--repo", "o/r", "--pr", "7", "extra"],
+            ["--repo", "o/r", "--pr", "7", "--unknown"],
+            ["--rep", "o/r", "--pr", "7"],
+            ["--repo", "o/r", "--pr", "7", "--no-post=yes"],
+            ["--repo", "o/r", "--pr"],
+            [],
+        ],
+    )
+    def test_matches_argparse(self, argv, capsys):
+        """Test accepted argv parse exactly like argparse; anything else returns None."""
+        fast = cli._parse_args_fast(argv)
+        expected = _parse_with_argparse(argv)
+
+        if expected is None:
+            assert fast is None
+        elif fast is not None:
+            assert vars(fast) == expected
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--repo", "o/r", "--pr", "7"],
+            ["--repo=o/r", "--pr=7", "--no-post", "--platform", "gitlab"],
+            ["--repo", "o/r", "--pr", "7", "--output", "out.json", "--project-root", "/src"],
+        ],
+    )
+    def test_common_invocations_take_fast_path(self, argv):
+        """Test typical CI invocations don't fall back to argparse."""
+        assert cli._parse_args_fast(argv) is not None
@@ -2,28 +2,49 @@
 Tests for ConfigManager.
 """
 
+import io
+import os
+
 import pytest
-import yaml
 
 from ai_review.config_manager import ConfigManager, ConfigurationError
 
+_PROJECT_CFG_YAML = "project_context:\n  name: Test Project\n"
+_BLOCK_ON_HIGH_YAML = "blocking_rules:\n  block_on_high: true\n"
+
+
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory):
+    """Read-only directory with the project config fixtures, created once per session."""
+    directory = tmp_path_factory.mktemp("cfg")
+    (directory / "config.yml").write_text(_PROJECT_CFG_YAML)
+    (directory / "project-config.yml").write_text(_BLOCK_ON_HIGH_YAML)
+    return directory
+
 
 class TestConfigManager:
     """Test suite for ConfigManager."""
 
-    def test_load_default_config(self):
+    def test_load_default_config(self, manager):
         """Test loading default configuration."""
-        manager = ConfigManager()
         config = manager.load_default_config()
 
         assert "review_aspects" in config
         assert "blocking_rules" in config
         assert isinstance(config["review_aspects"], list)
 
-    def test_merge_configs(self):
-        """Test merging multiple configurations."""
-        manager = ConfigManager()
+    def test_load_default_config_copy(self, manager):
+        """Test default config copies are independent and views are read-only."""
+        config = manager.load_default_config()
+        config["blocking_rules"]["block_on_high"] = True
+        assert manager.load_default_config()["blocking_rules"]["block_on_high"] is False
+
+        view = manager.load_default_config(copy=False)
+        with pytest.raises(TypeError):
+            view["blocking_rules"] = {}
 
+    def test_merge_configs(self, manager):
+        """Test merging multiple configurations."""
         base = {
             "review_aspects": [{"name": "test", "enabled": True}],
             "blocking_rules": {"block_on_critical": True},
@@ -37,10 +58,12 @@ class TestConfigManager:
         assert merged["new_key"] == "value"
         assert merged["review_aspects"] == base["review_aspects"]
 
-    def test_deep_merge(self):
-        """Test deep merging of nested dictionaries."""
-        manager = ConfigManager()
+        # Untouched subtrees are shared, and inputs are left as they were
+        assert merged["review_aspects"] is base["review_aspects"]
+        assert base["blocking_rules"]["block_on_critical"] is True
 
+    def test_deep_merge(self, manager):
+        """Test deep merging of nested dictionaries."""
         base = {"level1": {"level2": {"key1": "value1", "key2": "value2"}}}
 
         override = {"level1": {"level2": {"key2": "new_value2", "key3": "value3"}}}
@@ -51,17 +74,13 @@ class TestConfigManager:
         assert merged["level1"]["level2"]["key2"] == "new_value2"
         assert merged["level1"]["level2"]["key3"] == "value3"
 
-    def test_validate_config_valid(self):
+    def test_validate_config_valid(self, manager, default_config_cached):
         """Test validation of valid configuration."""
-        manager = ConfigManager()
-        config = manager.load_default_config()
-
         # Should not raise exception
-        manager.validate_config(config)
+        manager.validate_config(default_config_cached)
 
-    def test_validate_config_invalid(self):
+    def test_validate_config_invalid(self, manager):
         """Test validation of invalid configuration."""
-        manager = ConfigManager()
         invalid_config = {
             "review_aspects": "not a list"  # Should be a list
         }
@@ -69,20 +88,18 @@ class TestConfigManager:
         with pytest.raises(ConfigurationError):
             manager.validate_config(invalid_config)
 
-    def test_get_config_value(self):
+    def test_get_config_value(self, manager):
         """Test getting configuration values by key."""
-        manager = ConfigManager()
         manager.config = {"level1": {"level2": {"key": "value"}}}
 
         assert manager.get("level1.level2.key") == "value"
         assert manager.get("level1.level2.missing", "default") == "default"
         assert manager.get("missing.key", "default") == "default"
 
-    def test_resolve_config_references(self, monkeypatch):
+    def test_resolve_config_references(self, manager, monkeypatch):
         """Test resolving environment variable references."""
         monkeypatch.setenv("TEST_VAR", "test_value")
 
-        manager = ConfigManager()
         config = {
             "key1": "${TEST_VAR}",
             "key2": "prefix_${TEST_VAR}_suffix",
@@ -99,36 +116,111 @@ class TestConfigManager:
 class TestConfigLoading:
     """Test configuration loading from various sources."""
 
-    def test_load_project_config_file(self, tmp_path):
+    def test_load_project_config_file(self, manager, config_dir):
         """Test loading project config from file."""
-        config_file = tmp_path / "config.yml"
-        config_data = {"project_context": {"name": "Test Project"}}
+        config = manager.load_project_config(str(config_dir / "config.yml"))
 
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f)
+        assert config["project_context"]["name"] == "Test Project"
 
-        manager = ConfigManager(str(tmp_path))
-        config = manager.load_project_config(str(config_file))
+    def test_load_project_config_stream(self, manager):
+        """Test loading project config from an in-memory stream."""
+        config = manager.load_project_config_stream(io.StringIO(_PROJECT_CFG_YAML))
 
         assert config["project_context"]["name"] == "Test Project"
+        assert manager.load_project_config_stream(io.StringIO("")) == {}
+
+    def test_load_project_config_returns_copies(self, manager, config_dir):
+        """Test repeated loads of an unchanged file don't share state."""
+        config_file = config_dir / "config.yml"
 
-    def test_load_project_config_missing_file(self, tmp_path):
+        first = manager.load_project_config(str(config_file))
+        first["project_context"]["name"] = "Changed"
+
+        second = manager.load_project_config(str(config_file))
+        assert second["project_context"]["name"] == "Test Project"
+
+    def test_load_project_config_missing_file(self, manager):
         """Test loading config from non-existent file."""
-        manager = ConfigManager(str(tmp_path))
         config = manager.load_project_config("/nonexistent/config.yml")
 
         assert config == {}
 
-    def test_load_all_configs(self, tmp_path):
+    def test_load_all_configs(self, manager, config_dir):
         """Test loading and merging all configuration levels."""
-        # Create project config
-        project_config = tmp_path / "project-config.yml"
-        with open(project_config, "w") as f:
-            yaml.dump({"blocking_rules": {"block_on_high": True}}, f)
-
-        manager = ConfigManager(str(tmp_path))
+        project_config = config_dir / "project-config.yml"
         config = manager.load_all_configs(project_config_path=str(project_config))
 
         # Should have default config merged with project config
         assert "review_aspects" in config  # From default
         assert config["blocking_rules"]["block_on_high"] is True  # From project
+
+    def test_load_all_configs_does_not_share_defaults(self, tmp_path):
+        """Test nested values of the merged config can be mutated without touching defaults."""
+        config = ConfigManager(str(tmp_path)).load_all_configs()
+        config["blocking_rules"]["block_on_high"] = True
+        config["review_aspects"].clear()
+
+        default_config = ConfigManager().load_default_config(copy=False)
+        assert default_config["blocking_rules"]["block_on_high"] is False
+        assert default_config["review_aspects"]
+
+    def test_load_all_configs_cached(self, tmp_path):
+        """Test memoized loading returns copies and reloads when the file changes."""
+        project_config = tmp_path / "project-config.yml"
+        project_config.write_text(_BLOCK_ON_HIGH_YAML)
+
+        ConfigManager.invalidate_cache()
+        manager = ConfigManager(str(tmp_path))
+        config = manager.load_all_configs_cached(project_config_path=str(project_config))
+        config["blocking_rules"]["block_on_high"] = False
+
+        # Mutating the returned config must not leak into the cache
+        config = manager.load_all_configs_cached(project_config_path=str(project_config))
+        assert config["blocking_rules"]["block_on_high"] is True
+
+        project_config.write_text("blocking_rules:\n  block_on_high: false\n")
+        stat = project_config.stat()
+        os.utime(project_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        config = manager.load_all_configs_cached(project_config_path=str(project_config))
+        assert config["blocking_rules"]["block_on_high"] is False
+        ConfigManager.invalidate_cache()
+
+    def test_load_all_configs_cached_without_project_config(self, tmp_path):
+        """Test mutating a memoized result never reaches the default configuration."""
+        default_config = ConfigManager().load_default_config()
+
+        ConfigManager.invalidate_cache()
+        for _ in range(2):  # cache miss, then cache hit
+            config = ConfigManager(str(tmp_path)).load_all_configs_cached()
+            config["blocking_rules"]["block_on_high"] = True
+            config["review_aspects"].append({"name": "extra"})
+
+        assert ConfigManager.DEFAULT_CONFIG == default_config
+        assert ConfigManager().load_default_config() == default_config
+        ConfigManager.invalidate_cache()
+
+    def test_load_all_configs_cached_company_config(self, tmp_path):
+        """Test a failed company config is not cached and company file edits are picked up."""
+        company_config = tmp_path / "company-config.yml"
+        source = f"file://{company_config}"
+
+        ConfigManager.invalidate_cache()
+        manager = ConfigManager(str(tmp_path))
+
+        # Missing file: defaults are returned but the degraded result is not memoized
+        config = manager.load_all_configs_cached(company_config_source=source)
+        assert manager.company_config_failed
+        assert config["blocking_rules"]["block_on_high"] is False
+
+        company_config.write_text(_BLOCK_ON_HIGH_YAML)
+        config = manager.load_all_configs_cached(company_config_source=source)
+        assert config["blocking_rules"]["block_on_high"] is True
+
+        company_config.write_text("blocking_rules:\n  block_on_high: false\n")
+        stat = company_config.stat()
+        os.utime(company_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        config = manager.load_all_configs_cached(company_config_source=source)
+        assert config["blocking_rules"]["block_on_high"] is False
+        ConfigManager.invalidate_cache()
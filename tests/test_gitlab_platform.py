@@ -0,0 +1,96 @@
+"""
+Tests for GitLab change-type detection and changed-file fetching.
+"""
+
+import pytest
+
+from ai_review.models import ChangeType, FileChange
+from ai_review.platform.gitlab_platform import GitLabPlatform
+
+
+def _change(path: str, patch: str | None = "+x = 1\n") -> FileChange:
+    return FileChange(
+        path=path, status="modified", additions=1, deletions=0, changes=1, patch=patch
+    )
+
+
+@pytest.fixture(scope="module")
+def platform():
+    """GitLab platform with a dummy token (constructing the client makes no requests)."""
+    return GitLabPlatform("test-token")
+
+
+class TestPathRules:
+    """Test path-based change type detection."""
+
+    @pytest.mark.parametrize(
+        "path",
+        ["test_models.py", "src/test_utils.py", "tests/conftest.py", "pkg/test/helpers.go"],
+    )
+    def test_test_changes(self, platform, path):
+        """Test test_*.py and test directory rules."""
+        assert platform._has_test_changes([_change(path)])
+
+    @pytest.mark.parametrize("path", ["src/models.py", "latest.txt", "contest.py"])
+    def test_not_test_changes(self, platform, path):
+        """Test ordinary source files are not treated as tests."""
+        assert not platform._has_test_changes([_change(path)])
+
+    @pytest.mark.parametrize("path", ["doc/setup.txt", "docs/index.html", "README", "guide.rst"])
+    def test_documentation_changes(self, platform, path):
+        """Test doc/ directory, README and doc suffix rules."""
+        assert platform._has_documentation_changes([_change(path)])
+
+    def test_not_documentation_changes(self, platform):
+        """Test source files are not treated as documentation."""
+        assert not platform._has_documentation_changes([_change("src/doctor.py")])
+
+
+class TestDiffPatterns:
+    """Test diff-based change type detection."""
+
+    def test_security_pattern_in_path(self, platform):
+        """Test a security-sensitive path flags the change even with a harmless patch."""
+        found = platform._detect_diff_change_types([_change("src/auth/login.py")])
+
+        assert found == {ChangeType.SECURITY_RISK}
+
+    def test_innerhtml_pattern(self, platform):
+        """Test innerHTML is matched on the lowercased patch."""
+        change = _change("src/view.js", "+el.innerHTML = userInput;\n")
+
+        assert ChangeType.SECURITY_RISK in platform._detect_diff_change_types([change])
+
+    def test_removed_definition_is_breaking(self, platform):
+        """Test a removed def line is a breaking change."""
+        change = _change("src/api.py", "-def handler(request):\n+pass\n")
+
+        assert platform._detect_diff_change_types([change]) == {ChangeType.BREAKING_CHANGE}
+
+    def test_added_definition_is_not_breaking(self, platform):
+        """Test an added def line is not a breaking change."""
+        change = _change("src/api.py", "+def handler(request):\n")
+
+        assert platform._detect_diff_change_types([change]) == set()
+
+    def test_defaults_to_feature(self, platform):
+        """Test plain source changes default to a feature."""
+        assert platform._detect_change_types([_change("src/app.py")]) == [ChangeType.FEATURE]
+
+
+class TestChangedFiles:
+    """Test fetching changed files from an MR."""
+
+    def test_overflow_keeps_capped_list_when_paging_fails(self, platform, monkeypatch):
+        """Test a failing /diffs fallback still reviews the files /changes returned."""
+
+        class StubMR:
+            def changes(self, access_raw_diffs=False):
+                return {"overflow": True, "changes": [{"new_path": "a.py", "diff": "+x\n"}]}
+
+        def fail(mr):
+            raise RuntimeError("404 Not Found")
+
+        monkeypatch.setattr(platform, "_list_mr_diffs", fail)
+
+        assert [f.path for f in platform._get_changed_files(StubMR())] == ["a.py"]
@@ -2,13 +2,14 @@
 Tests for data models.
 """
 
+import dataclasses
+
+import pytest
+
 from ai_review.models import (
     AggregatedResults,
     ChangeType,
-    FileChange,
-    Finding,
     FindingCategory,
-    PRContext,
     ReviewResult,
     Severity,
 )
@@ -17,35 +18,16 @@ from ai_review.models import (
 class TestFinding:
     """Test Finding model."""
 
-    def test_finding_creation(self):
+    def test_finding_creation(self, sample_finding):
         """Test creating a Finding instance."""
-        finding = Finding(
-            file_path="test.py",
-            line_number=10,
-            severity=Severity.HIGH,
-            category=FindingCategory.SECURITY,
-            message="SQL injection vulnerability",
-            suggestion="Use parameterized queries",
-        )
+        assert sample_finding.file_path == "test.py"
+        assert sample_finding.line_number == 10
+        assert sample_finding.severity == Severity.HIGH
+        assert sample_finding.category == FindingCategory.SECURITY
 
-        assert finding.file_path == "test.py"
-        assert finding.line_number == 10
-        assert finding.severity == Severity.HIGH
-        assert finding.category == FindingCategory.SECURITY
-
-    def test_finding_to_dict(self):
+    def test_finding_to_dict(self, sample_finding):
         """Test converting Finding to dictionary."""
-        finding = Finding(
-            file_path="test.py",
-            line_number=10,
-            severity=Severity.HIGH,
-            category=FindingCategory.SECURITY,
-            message="Test message",
-            tool="bandit",
-            rule_id="B608",
-        )
-
-        result = finding.to_dict()
+        result = sample_finding.to_dict()
 
         assert result["file_path"] == "test.py"
         assert result["line_number"] == 10
@@ -53,52 +35,34 @@ class TestFinding:
         assert result["category"] == "security"
         assert result["tool"] == "bandit"
 
+    def test_finding_to_dict_matches_dataclass_fields(self, sample_finding):
+        """Test to_dict() returns a fresh dict and adds nothing to the dataclass fields."""
+        first = sample_finding.to_dict()
+        first["message"] = "changed"
+
+        assert sample_finding.to_dict()["message"] == sample_finding.message
+        assert list(dataclasses.asdict(sample_finding)) == list(first)
+
 
 class TestPRContext:
     """Test PRContext model."""
 
-    def test_pr_context_creation(self):
+    def test_pr_context_creation(self, sample_pr_context):
         """Test creating a PRContext instance."""
-        file_change = FileChange(
-            path="test.py", status="modified", additions=10, deletions=5, changes=15
-        )
-
-        pr_context = PRContext(
-            pr_number=123,
-            title="Test PR",
-            description="Test description",
-            author="testuser",
-            base_branch="main",
-            head_branch="feature/test",
-            labels=["bug", "high-priority"],
-            changed_files=[file_change],
-            diff="test diff",
-            detected_languages=["python"],
-            change_types=[ChangeType.BUGFIX],
-        )
-
-        assert pr_context.pr_number == 123
-        assert pr_context.title == "Test PR"
-        assert len(pr_context.changed_files) == 1
-        assert pr_context.detected_languages == ["python"]
-        assert ChangeType.BUGFIX in pr_context.change_types
+        assert sample_pr_context.pr_number == 123
+        assert sample_pr_context.title == "Test PR"
+        assert len(sample_pr_context.changed_files) == 1
+        assert sample_pr_context.detected_languages == ["python"]
+        assert ChangeType.BUGFIX in sample_pr_context.change_types
 
 
 class TestReviewResult:
     """Test ReviewResult model."""
 
-    def test_review_result_creation(self):
+    def test_review_result_creation(self, sample_finding):
         """Test creating a ReviewResult instance."""
-        finding = Finding(
-            file_path="test.py",
-            line_number=10,
-            severity=Severity.MEDIUM,
-            category=FindingCategory.CODE_QUALITY,
-            message="Test finding",
-        )
-
         result = ReviewResult(
-            aspect_name="code_quality", findings=[finding], execution_time=1.5, success=True
+            aspect_name="code_quality", findings=[sample_finding], execution_time=1.5, success=True
         )
 
         assert result.aspect_name == "code_quality"
@@ -110,41 +74,14 @@ class TestReviewResult:
 class TestAggregatedResults:
     """Test AggregatedResults model."""
 
-    def test_aggregated_results_to_dict(self):
+    def test_aggregated_results_to_dict(
+        self, sample_pr_context, sample_review_result, sample_finding
+    ):
         """Test converting AggregatedResults to dictionary."""
-        file_change = FileChange(
-            path="test.py", status="modified", additions=10, deletions=5, changes=15
-        )
-
-        pr_context = PRContext(
-            pr_number=123,
-            title="Test PR",
-            description="Test",
-            author="testuser",
-            base_branch="main",
-            head_branch="feature/test",
-            labels=[],
-            changed_files=[file_change],
-            diff="",
-            detected_languages=["python"],
-        )
-
-        finding = Finding(
-            file_path="test.py",
-            line_number=10,
-            severity=Severity.HIGH,
-            category=FindingCategory.SECURITY,
-            message="Test finding",
-        )
-
-        review_result = ReviewResult(
-            aspect_name="security", findings=[finding], execution_time=1.0, success=True
-        )
-
         aggregated = AggregatedResults(
-            pr_context=pr_context,
-            review_results=[review_result],
-            all_findings=[finding],
+            pr_context=sample_pr_context,
+            review_results=[sample_review_result],
+            all_findings=[sample_finding],
             statistics={"total": 1},
             should_block=True,
             blocking_reason="Critical issues found",
@@ -164,22 +101,22 @@ class TestAggregatedResults:
 class TestEnums:
     """Test enum types."""
 
-    def test_severity_enum(self):
-        """Test Severity enum."""
-        assert Severity.CRITICAL.value == "critical"
-        assert Severity.HIGH.value == "high"
-        assert Severity.MEDIUM.value == "medium"
-        assert Severity.LOW.value == "low"
-        assert Severity.INFO.value == "info"
-
-    def test_finding_category_enum(self):
-        """Test FindingCategory enum."""
-        assert FindingCategory.SECURITY.value == "security"
-        assert FindingCategory.PERFORMANCE.value == "performance"
-        assert FindingCategory.ARCHITECTURE.value == "architecture"
-
-    def test_change_type_enum(self):
-        """Test ChangeType enum."""
-        assert ChangeType.FEATURE.value == "feature"
-        assert ChangeType.BUGFIX.value == "bugfix"
-        assert ChangeType.SECURITY_RISK.value == "security_risk"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (Severity.CRITICAL, "critical"),
+            (Severity.HIGH, "high"),
+            (Severity.MEDIUM, "medium"),
+            (Severity.LOW, "low"),
+            (Severity.INFO, "info"),
+            (FindingCategory.SECURITY, "security"),
+            (FindingCategory.PERFORMANCE, "performance"),
+            (FindingCategory.ARCHITECTURE, "architecture"),
+            (ChangeType.FEATURE, "feature"),
+            (ChangeType.BUGFIX, "bugfix"),
+            (ChangeType.SECURITY_RISK, "security_risk"),
+        ],
+    )
+    def test_enum_value(self, member, expected):
+        """Test Severity, FindingCategory and ChangeType values."""
+        assert member.value == expected